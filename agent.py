@@ -7,12 +7,38 @@ Includes rate limit handling for Claude Pro subscription usage.
 """
 
 import asyncio
+import functools
+import os
+import random
+import re
+import reprlib
+import signal
+import sys
 import time
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Optional
 
 from claude_agent_sdk import ClaudeSDKClient
 
+try:
+    from claude_agent_sdk import (
+        AssistantMessage,
+        TextBlock,
+        ToolResultBlock,
+        ToolUseBlock,
+        UserMessage,
+    )
+except ImportError:
+    # Older SDK versions don't export these at top level: dispatch on names
+    AssistantMessage, UserMessage = "AssistantMessage", "UserMessage"
+    TextBlock, ToolUseBlock, ToolResultBlock = "TextBlock", "ToolUseBlock", "ToolResultBlock"
+
+    def _type_key(obj) -> str:
+        return type(obj).__name__
+else:
+    _type_key = type
+
 from client import create_client
 from progress import print_session_header, print_progress_summary
 from prompts import get_initializer_prompt, get_coding_prompt, copy_spec_to_project
@@ -22,98 +48,286 @@ from prompts import get_initializer_prompt, get_coding_prompt, copy_spec_to_proj
 AUTO_CONTINUE_DELAY_SECONDS = 3
 
 # Rate limit handling configuration
-# Fallback wait times when retry-after header is not available:
+# Fallback wait when retry-after header is not available: exponential backoff
+# with jitter starting from BASE_FALLBACK_SECONDS, capped at:
 #   - First fallback: 5 hours
 #   - If throttled again immediately after fallback wait: 24 hours
+BASE_FALLBACK_SECONDS = 60  # 1 minute
 FALLBACK_WAIT_FIRST_SECONDS = 5 * 60 * 60   # 5 hours
 FALLBACK_WAIT_EXTENDED_SECONDS = 24 * 60 * 60  # 24 hours
 MAX_RATE_LIMIT_WAIT_SECONDS = 24 * 60 * 60  # 24 hours max wait
 RATE_LIMIT_RETRY_COUNT = 10  # Max retries before giving up
 
+# Console banners
+_BAR_EQ = "=" * 70
+_BAR_DASH = "-" * 70
+_SESSION_END = f"\n{_BAR_DASH}\n\n"
+_RATE_LIMIT_BANNER = (
+    f"\n{_BAR_EQ}\n"
+    "  ⏳ RATE LIMITED - Pro subscription quota reached\n"
+    f"{_BAR_EQ}\n"
+)
+_FIRST_SESSION_NOTE = (
+    f"\n{_BAR_EQ}\n"
+    "  NOTE: First session takes 10-20+ minutes!\n"
+    "  The agent is generating 200 detailed test cases.\n"
+    "  This may appear to hang - it's working. Watch for [Tool: ...] output.\n"
+    f"{_BAR_EQ}\n\n"
+)
+
+# Rate limit detection patterns (compiled once at import)
+_RATE_LIMIT_INDICATOR_RE = re.compile(
+    r"rate[ _]limit|429|too many requests|quota exceeded|overloaded", re.I
+)
+
+# Look for "retry-after: X" or "retry_after: X" or "wait X seconds"
+_RETRY_PATTERNS = [
+    re.compile(p, re.I)
+    for p in (
+        r'retry[-_]after[:\s]+(\d+)',
+        r'wait\s+(\d+)\s*(?:seconds?|s)',
+        r'try again in\s+(\d+)',
+        r'(\d+)\s*seconds?\s+(?:before|until)',
+    )
+]
+
+# Retry-After may also be an HTTP-date (RFC 7231), e.g.
+# "Retry-After: Wed, 21 Oct 2015 07:28:00 GMT"
+_RETRY_AFTER_DATE_RE = re.compile(
+    r'retry[-_]after[:\s]+([A-Za-z]{3},\s*\d{1,2}\s+[A-Za-z]{3}\s+\d{4}\s+\d{2}:\d{2}:\d{2}\s+GMT)',
+    re.I,
+)
+
+# Set to cut a rate limit wait short (e.g. `kill -USR1 <pid>`); created in
+# run_autonomous_agent so it binds to the running event loop
+_rate_limit_abort: Optional[asyncio.Event] = None
+
+
+@functools.lru_cache(maxsize=256)
+def _find_retry_hint(error_str: str) -> Optional[tuple[Optional[int], Optional[float]]]:
+    """
+    Scan a rate limit error for a retry hint.
+    
+    Cached because rate limit cascades repeat the same error text. Returns
+    (delay_seconds, retry_at_timestamp) with one of the two set, or None if
+    this isn't a rate limit error or carries no hint. Absolute timestamps are
+    returned as-is so the cached value doesn't go stale.
+    """
+    # Check if this is a rate limit error
+    if not _RATE_LIMIT_INDICATOR_RE.search(error_str):
+        return None
+    
+    # Try to extract retry-after value
+    for pattern in _RETRY_PATTERNS:
+        match = pattern.search(error_str)
+        if match:
+            return int(match.group(1)), None
+    
+    # Retry-after given as an HTTP-date
+    match = _RETRY_AFTER_DATE_RE.search(error_str)
+    if match:
+        try:
+            return None, parsedate_to_datetime(match.group(1)).timestamp()
+        except (TypeError, ValueError):
+            pass
+    
+    return None
+
 
 def parse_rate_limit_error(error_str: str) -> Optional[int]:
     """
     Parse rate limit error to extract wait time.
     
     Looks for:
-    - retry-after header value
+    - retry-after header value (delay-seconds or HTTP-date)
     - Common patterns in error messages
     
     Returns wait time in seconds, or None if not a rate limit error.
     """
-    error_lower = error_str.lower()
-    
-    # Check if this is a rate limit error
-    rate_limit_indicators = [
-        "rate limit",
-        "rate_limit",
-        "429",
-        "too many requests",
-        "quota exceeded",
-        "overloaded",
-    ]
-    
-    is_rate_limit = any(indicator in error_lower for indicator in rate_limit_indicators)
-    if not is_rate_limit:
+    hint = _find_retry_hint(error_str)
+    if hint is None:
+        # No specific time found, return None to signal fallback should be used
         return None
     
-    # Try to extract retry-after value
-    import re
-    
-    # Look for "retry-after: X" or "retry_after: X" or "wait X seconds"
-    patterns = [
-        r'retry[-_]after[:\s]+(\d+)',
-        r'wait\s+(\d+)\s*(?:seconds?|s)',
-        r'try again in\s+(\d+)',
-        r'(\d+)\s*seconds?\s+(?:before|until)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, error_lower)
-        if match:
-            return int(match.group(1))
+    delay_seconds, retry_at = hint
+    if delay_seconds is not None:
+        return delay_seconds
     
-    # No specific time found, return None to signal fallback should be used
-    return None
+    # HTTP-date: wait until that timestamp
+    wait = max(0, int(retry_at - time.time()))
+    return min(wait, MAX_RATE_LIMIT_WAIT_SECONDS)
 
 
-def get_fallback_wait_time(used_fallback_last_time: bool) -> int:
+def get_fallback_wait_time(used_fallback_last_time: bool, retry_count: int = 0) -> int:
     """
     Get the fallback wait time when retry-after header is not available.
     
     Args:
         used_fallback_last_time: True if the previous wait also used fallback
                                  (no header was found then either)
+        retry_count: Number of consecutive rate limit retries so far
     
     Returns:
-        Wait time in seconds:
+        Wait time in seconds: BASE_FALLBACK_SECONDS doubled per retry plus
+        up to BASE_FALLBACK_SECONDS of jitter, capped at
         - 5 hours on first fallback
         - 24 hours if throttled again immediately after a fallback wait
     """
     if used_fallback_last_time:
-        return FALLBACK_WAIT_EXTENDED_SECONDS
-    return FALLBACK_WAIT_FIRST_SECONDS
+        ceiling = FALLBACK_WAIT_EXTENDED_SECONDS
+    else:
+        ceiling = FALLBACK_WAIT_FIRST_SECONDS
+    ceiling = min(ceiling, MAX_RATE_LIMIT_WAIT_SECONDS)
+    
+    backoff = BASE_FALLBACK_SECONDS * (2 ** min(retry_count, 10))
+    jitter = random.uniform(0, BASE_FALLBACK_SECONDS)
+    return int(min(ceiling, backoff + jitter))
 
 
 def format_wait_time(seconds: int) -> str:
     """Format seconds into human-readable string."""
-    if seconds < 60:
-        return f"{seconds} seconds"
-    elif seconds < 3600:
-        minutes = seconds // 60
-        return f"{minutes} minute{'s' if minutes != 1 else ''}"
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
+        hours_str = f"{hours} hour{'' if hours == 1 else 's'}"
+        return f"{hours_str} {minutes} min" if minutes else hours_str
+    if minutes:
+        return f"{minutes} minute{'' if minutes == 1 else 's'}"
+    return f"{secs} seconds"
+
+
+class _StreamOutput:
+    """
+    Stdout writer for streamed session output.
+
+    Assistant text arrives in many small chunks, so it is written without
+    flushing and only flushed on a newline, once FLUSH_BYTES are pending, or
+    FLUSH_INTERVAL seconds after the first unflushed chunk. Low-rate tool
+    events flush explicitly via flush().
+    """
+
+    FLUSH_BYTES = 4096
+    FLUSH_INTERVAL = 0.1  # seconds
+
+    def __init__(self) -> None:
+        self._stdout = sys.stdout
+        self.write = self._stdout.write
+        self._pending = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def write_text(self, chunk: str) -> None:
+        self.write(chunk)
+        self._pending += len(chunk)
+        if chunk.endswith("\n") or self._pending > self.FLUSH_BYTES:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.FLUSH_INTERVAL, self.flush
+            )
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = 0
+        self._stdout.flush()
+
+
+# Bounded repr for non-text tool results, so large payloads aren't
+# stringified in full just to show a truncated error
+_RESULT_REPR = reprlib.Repr()
+_RESULT_REPR.maxstring = 500
+_RESULT_REPR.maxother = 500
+
+
+def _show_text_block(block, out: _StreamOutput) -> str:
+    """Echo assistant text as it streams in."""
+    text = block.text
+    out.write_text(text)
+    return text
+
+
+def _show_tool_use_block(block, out: _StreamOutput) -> str:
+    """Show which tool the agent is calling and a preview of its input."""
+    out.write(f"\n[Tool: {block.name}]\n")
+    input_str = str(block.input)
+    if len(input_str) > 200:
+        out.write(f"   Input: {input_str[:200]}...\n")
     else:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        if minutes > 0:
-            return f"{hours} hour{'s' if hours != 1 else ''} {minutes} min"
-        return f"{hours} hour{'s' if hours != 1 else ''}"
+        out.write(f"   Input: {input_str}\n")
+    out.flush()
+    return ""
+
+
+def _show_tool_result_block(block, out: _StreamOutput) -> str:
+    """Show a one-line summary of a tool result."""
+    result_content = block.content
+    is_error = block.is_error
+    is_text = isinstance(result_content, str)
+
+    # Check if command was blocked by security hook. The notice is a short
+    # string, so non-text results (e.g. screenshot blocks) are never probed
+    if is_text and "blocked" in result_content[:200].lower():
+        out.write(f"   [BLOCKED] {result_content}\n")
+    elif is_error:
+        # Show errors (truncated)
+        if is_text:
+            error_str = result_content[:500]
+        else:
+            error_str = _RESULT_REPR.repr(result_content)[:500]
+        out.write(f"   [Error] {error_str}\n")
+    else:
+        # Tool succeeded - just show brief confirmation
+        out.write("   [Done]\n")
+    out.flush()
+    return ""
+
+
+# Block handlers per message class: AssistantMessage carries text and tool
+# use, UserMessage carries tool results (its other blocks, e.g. interrupt
+# notices, aren't assistant output and are not echoed)
+_MSG_BLOCK_HANDLERS = {
+    AssistantMessage: {
+        TextBlock: _show_text_block,
+        ToolUseBlock: _show_tool_use_block,
+    },
+    UserMessage: {
+        ToolResultBlock: _show_tool_result_block,
+    },
+}
+
+
+def _show_message(
+    msg,
+    block_handlers: dict,
+    out: _StreamOutput,
+    chunks: Optional[list[str]],
+) -> None:
+    """Show each content block of a message, appending any assistant text to chunks."""
+    # The SDK's message and block dataclasses always carry the fields the
+    # handlers read, so access them directly and only skip on a mismatch
+    try:
+        blocks = msg.content
+    except AttributeError:
+        return
+    for block in blocks:
+        handler = block_handlers.get(_type_key(block))
+        if handler is None:
+            continue
+        try:
+            text = handler(block, out)
+        except AttributeError:
+            continue
+        if text and chunks is not None:
+            chunks.append(text)
 
 
 async def run_agent_session(
     client: ClaudeSDKClient,
     message: str,
     project_dir: Path,
+    *,
+    capture_text: bool = False,
 ) -> tuple[str, str]:
     """
     Run a single agent session using Claude Agent SDK.
@@ -122,9 +336,12 @@ async def run_agent_session(
         client: Claude SDK client
         message: The prompt to send
         project_dir: Project directory path
+        capture_text: Collect the assistant's text into response_text.
+                      Off by default since it is only echoed to stdout.
 
     Returns:
-        (status, response_text) where status is:
+        (status, response_text) where response_text is "" on success unless
+        capture_text is set, and status is:
         - "continue" if agent should continue working
         - "rate_limited" if hit rate limit (caller should wait and retry)
         - "error" if an error occurred
@@ -136,49 +353,18 @@ async def run_agent_session(
         await client.query(message)
 
         # Collect response text and show tool use
-        response_text = ""
-        async for msg in client.receive_response():
-            msg_type = type(msg).__name__
-
-            # Handle AssistantMessage (text and tool use)
-            if msg_type == "AssistantMessage" and hasattr(msg, "content"):
-                for block in msg.content:
-                    block_type = type(block).__name__
-
-                    if block_type == "TextBlock" and hasattr(block, "text"):
-                        response_text += block.text
-                        print(block.text, end="", flush=True)
-                    elif block_type == "ToolUseBlock" and hasattr(block, "name"):
-                        print(f"\n[Tool: {block.name}]", flush=True)
-                        if hasattr(block, "input"):
-                            input_str = str(block.input)
-                            if len(input_str) > 200:
-                                print(f"   Input: {input_str[:200]}...", flush=True)
-                            else:
-                                print(f"   Input: {input_str}", flush=True)
-
-            # Handle UserMessage (tool results)
-            elif msg_type == "UserMessage" and hasattr(msg, "content"):
-                for block in msg.content:
-                    block_type = type(block).__name__
-
-                    if block_type == "ToolResultBlock":
-                        result_content = getattr(block, "content", "")
-                        is_error = getattr(block, "is_error", False)
-
-                        # Check if command was blocked by security hook
-                        if "blocked" in str(result_content).lower():
-                            print(f"   [BLOCKED] {result_content}", flush=True)
-                        elif is_error:
-                            # Show errors (truncated)
-                            error_str = str(result_content)[:500]
-                            print(f"   [Error] {error_str}", flush=True)
-                        else:
-                            # Tool succeeded - just show brief confirmation
-                            print("   [Done]", flush=True)
-
-        print("\n" + "-" * 70 + "\n")
-        return "continue", response_text
+        response_chunks: Optional[list[str]] = [] if capture_text else None
+        out = _StreamOutput()
+        try:
+            async for msg in client.receive_response():
+                block_handlers = _MSG_BLOCK_HANDLERS.get(_type_key(msg))
+                if block_handlers is not None:
+                    _show_message(msg, block_handlers, out, response_chunks)
+        finally:
+            out.flush()
+
+        sys.stdout.write(_SESSION_END)
+        return "continue", "".join(response_chunks or ())
 
     except Exception as e:
         error_str = str(e)
@@ -188,34 +374,63 @@ async def run_agent_session(
         wait_time = parse_rate_limit_error(error_str)
         if wait_time is not None:
             return "rate_limited", str(wait_time)
+        if _RATE_LIMIT_INDICATOR_RE.search(error_str):
+            # Rate limited but no retry hint: caller uses the fallback wait
+            return "rate_limited", ""
         
         return "error", error_str
 
 
-async def handle_rate_limit(wait_seconds: int) -> None:
+async def handle_rate_limit(
+    wait_seconds: int,
+    abort: Optional[asyncio.Event] = None,
+) -> None:
     """
     Handle rate limit by waiting with progress display.
     
     Args:
         wait_seconds: Number of seconds to wait
+        abort: Optional event that ends the wait early when set
     """
-    print("\n" + "=" * 70)
-    print("  ⏳ RATE LIMITED - Pro subscription quota reached")
-    print("=" * 70)
+    sys.stdout.write(_RATE_LIMIT_BANNER)
     print(f"\nWaiting {format_wait_time(wait_seconds)} before resuming...")
     print("(The agent will automatically continue after the wait)")
     print()
     
-    # Show countdown every minute for long waits, every 10 seconds for short
-    update_interval = 60 if wait_seconds > 120 else 10
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait_seconds
+    countdown = None
     
-    remaining = wait_seconds
-    while remaining > 0:
-        wait_chunk = min(update_interval, remaining)
-        await asyncio.sleep(wait_chunk)
-        remaining -= wait_chunk
-        if remaining > 0:
-            print(f"  ... {format_wait_time(remaining)} remaining", flush=True)
+    # Only show a live countdown on an interactive terminal; updates are
+    # timer-driven and rewrite the same line, capped at ~50 per wait
+    if sys.stdout.isatty():
+        update_interval = max(60, wait_seconds // 50)
+        
+        def show_remaining() -> None:
+            nonlocal countdown
+            remaining = int(deadline - loop.time())
+            if remaining <= 0:
+                return
+            sys.stdout.write(f"\r  ... {format_wait_time(remaining)} remaining\033[K")
+            sys.stdout.flush()
+            countdown = loop.call_later(update_interval, show_remaining)
+        
+        countdown = loop.call_later(update_interval, show_remaining)
+    
+    try:
+        if abort is None:
+            await asyncio.sleep(wait_seconds)
+        else:
+            # Drop any signal that arrived outside a wait, so only one sent
+            # during this wait can cut it short
+            abort.clear()
+            await asyncio.wait_for(abort.wait(), timeout=wait_seconds)
+            print("\n⏭  Wait cancelled early")
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        if countdown is not None:
+            countdown.cancel()
     
     print("\n✓ Wait complete! Resuming agent...\n")
 
@@ -240,9 +455,9 @@ async def run_autonomous_agent(
     # Check if using hybrid mode
     is_hybrid = planning_model != coding_model
     
-    print("\n" + "=" * 70)
+    print(f"\n{_BAR_EQ}")
     print("  AUTONOMOUS CODING AGENT")
-    print("=" * 70)
+    print(_BAR_EQ)
     print(f"\nProject directory: {project_dir}")
     
     if is_hybrid:
@@ -258,34 +473,42 @@ async def run_autonomous_agent(
         print("Max iterations: Unlimited (will run until completion)")
     print("\n💡 Rate limit handling: ENABLED")
     print("   Agent will auto-wait and resume if Pro quota is exceeded")
-    print()
 
-    # Create project directory
-    project_dir.mkdir(parents=True, exist_ok=True)
+    # Allow operators to skip a rate limit wait without restarting
+    global _rate_limit_abort
+    _rate_limit_abort = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGUSR1, _rate_limit_abort.set)
+        print(f"   Send SIGUSR1 to skip a wait: kill -USR1 {os.getpid()}")
+    except (AttributeError, NotImplementedError, RuntimeError):
+        # SIGUSR1 is not available on Windows
+        pass
+    print()
 
-    # Check if this is a fresh start or continuation
+    # Create project directory and check if this is a fresh start or
+    # continuation; the checks are independent, so run them concurrently
     tests_file = project_dir / "feature_list.json"
-    is_first_run = not tests_file.exists()
+    _, tests_exist = await asyncio.gather(
+        asyncio.to_thread(project_dir.mkdir, parents=True, exist_ok=True),
+        asyncio.to_thread(tests_file.exists),
+    )
+    is_first_run = not tests_exist
 
     if is_first_run:
         print("Fresh start - will use initializer agent")
-        print()
-        print("=" * 70)
-        print("  NOTE: First session takes 10-20+ minutes!")
-        print("  The agent is generating 200 detailed test cases.")
-        print("  This may appear to hang - it's working. Watch for [Tool: ...] output.")
-        print("=" * 70)
-        print()
+        sys.stdout.write(_FIRST_SESSION_NOTE)
         # Copy the app spec into the project directory for the agent to read
-        copy_spec_to_project(project_dir, spec_file)
+        await asyncio.to_thread(copy_spec_to_project, project_dir, spec_file)
     else:
         print("Continuing existing project")
-        print_progress_summary(project_dir)
+        await asyncio.to_thread(print_progress_summary, project_dir)
 
     # Main loop
     iteration = 0
     rate_limit_retries = 0
     last_wait_used_fallback = False  # Track if previous wait used fallback (no header)
+    clients: dict[str, ClaudeSDKClient] = {}  # One configured client per model
 
     while True:
         iteration += 1
@@ -310,10 +533,13 @@ async def run_autonomous_agent(
             prompt = get_coding_prompt()
             current_model = coding_model
 
-        # Create client (fresh context) with appropriate model
-        client = create_client(project_dir, current_model)
+        # Reuse the client configured for this model; hybrid mode keeps two
+        client = clients.get(current_model)
+        if client is None:
+            client = clients[current_model] = create_client(project_dir, current_model)
 
-        # Run session with async context manager
+        # Each `async with` connects a new CLI session, so every iteration
+        # still starts with a fresh context
         async with client:
             status, response = await run_agent_session(client, prompt, project_dir)
 
@@ -334,23 +560,24 @@ async def run_autonomous_agent(
                 break
             
             # Try to parse wait time from response (retry-after header)
-            # If not found, use fallback: 5 hours first, 24 hours if throttled again immediately
+            # If not found, back off exponentially with jitter from BASE_FALLBACK_SECONDS;
+            # the wait is capped at 5 hours, raised to 24 hours if the previous wait also had no header
             try:
                 wait_seconds = int(response)
                 used_fallback = False
                 print(f"\n⚠️  Rate limit hit - waiting {format_wait_time(wait_seconds)} (from header)")
             except (ValueError, TypeError):
-                wait_seconds = get_fallback_wait_time(last_wait_used_fallback)
+                wait_seconds = get_fallback_wait_time(last_wait_used_fallback, rate_limit_retries)
                 used_fallback = True
                 if last_wait_used_fallback:
-                    print(f"\n⚠️  Rate limit hit again after fallback wait - extended wait: {format_wait_time(wait_seconds)}")
+                    print(f"\n⚠️  Rate limit hit again (no header) - backing off: {format_wait_time(wait_seconds)}")
                 else:
-                    print(f"\n⚠️  Rate limit hit (no header) - fallback wait: {format_wait_time(wait_seconds)}")
+                    print(f"\n⚠️  Rate limit hit (no header) - backing off: {format_wait_time(wait_seconds)}")
             
             print(f"   (attempt {rate_limit_retries}/{RATE_LIMIT_RETRY_COUNT})")
             
             # Handle the rate limit wait
-            await handle_rate_limit(wait_seconds)
+            await handle_rate_limit(wait_seconds, _rate_limit_abort)
             
             # Track whether this wait used fallback for next iteration
             last_wait_used_fallback = used_fallback
@@ -369,21 +596,21 @@ async def run_autonomous_agent(
             await asyncio.sleep(1)
 
     # Final summary
-    print("\n" + "=" * 70)
+    print(f"\n{_BAR_EQ}")
     print("  SESSION COMPLETE")
-    print("=" * 70)
+    print(_BAR_EQ)
     print(f"\nProject directory: {project_dir}")
     print_progress_summary(project_dir)
 
     # Print instructions for running the generated application
-    print("\n" + "-" * 70)
+    print(f"\n{_BAR_DASH}")
     print("  TO RUN THE GENERATED APPLICATION:")
-    print("-" * 70)
+    print(_BAR_DASH)
     print(f"\n  cd {project_dir.resolve()}")
     print("  ./init.sh           # Run the setup script")
     print("  # Or manually:")
     print("  npm install && npm run dev")
     print("\n  Then open http://localhost:5173")
-    print("-" * 70)
+    print(_BAR_DASH)
 
     print("\nDone!")
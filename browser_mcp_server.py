@@ -14,11 +14,17 @@ This server exposes browser automation tools via stdio MCP protocol.
 """
 
 import asyncio
+import copy
 import json
 import sys
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib
+    orjson = None
+
 # Add browser-use-demo to path
 BROWSER_USE_DEMO_PATH = Path(__file__).parent.parent / "browser-use-demo"
 sys.path.insert(0, str(BROWSER_USE_DEMO_PATH))
@@ -26,6 +32,31 @@ sys.path.insert(0, str(BROWSER_USE_DEMO_PATH))
 from browser_use_demo.tools.browser import BrowserTool, BROWSER_TOOL_INPUT_SCHEMA
 
 
+# Screenshot responses carry multi-MB base64 payloads, well past the
+# default 64KB StreamReader line limit
+STDIN_BUFFER_LIMIT = 8 * 1024 * 1024
+
+# All actions drive the same Playwright page, so browser calls run one at a
+# time; other requests (initialize, tools/list) are answered meanwhile
+MAX_CONCURRENT_BROWSER_ACTIONS = 1
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _write_message(out, obj: Any) -> None:
+        """Write obj as one newline-terminated JSON line."""
+        out.write(orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE))
+else:
+    _json_loads = json.loads
+
+    def _write_message(out, obj: Any) -> None:
+        """Write obj as one newline-terminated JSON line."""
+        # Separate newline write avoids copying a multi-MB payload to append it
+        out.write(json.dumps(obj).encode("utf-8"))
+        out.write(b"\n")
+
+
 class BrowserMCPServer:
     """
     MCP Server that wraps BrowserTool for Claude Code SDK integration.
@@ -36,6 +67,28 @@ class BrowserMCPServer:
     def __init__(self):
         self.browser_tool = BrowserTool()
         self.running = True
+        self._browser_slots = asyncio.Semaphore(MAX_CONCURRENT_BROWSER_ACTIONS)
+        
+        # Static results, built once and reused for every request
+        self._initialize_result = {
+            "protocolVersion": "2024-11-05",
+            "serverInfo": {
+                "name": "browser-visual-testing",
+                "version": "1.0.0"
+            },
+            "capabilities": {
+                "tools": {}
+            }
+        }
+        self._tools_list_result = {
+            "tools": [
+                {
+                    "name": "browser_visual_test",
+                    "description": self._get_tool_description(),
+                    "inputSchema": self._get_input_schema()
+                }
+            ]
+        }
     
     async def handle_request(self, request: dict) -> dict:
         """Handle a single JSON-RPC request."""
@@ -45,34 +98,18 @@ class BrowserMCPServer:
         
         try:
             if method == "initialize":
-                return self._make_response(request_id, {
-                    "protocolVersion": "2024-11-05",
-                    "serverInfo": {
-                        "name": "browser-visual-testing",
-                        "version": "1.0.0"
-                    },
-                    "capabilities": {
-                        "tools": {}
-                    }
-                })
+                return self._make_response(request_id, self._initialize_result)
             
             elif method == "tools/list":
-                return self._make_response(request_id, {
-                    "tools": [
-                        {
-                            "name": "browser_visual_test",
-                            "description": self._get_tool_description(),
-                            "inputSchema": self._get_input_schema()
-                        }
-                    ]
-                })
+                return self._make_response(request_id, self._tools_list_result)
             
             elif method == "tools/call":
                 tool_name = params.get("name", "")
                 tool_args = params.get("arguments", {})
                 
                 if tool_name == "browser_visual_test":
-                    result = await self._execute_browser_action(tool_args)
+                    async with self._browser_slots:
+                        result = await self._execute_browser_action(tool_args)
                     return self._make_response(request_id, {
                         "content": result
                     })
@@ -135,7 +172,8 @@ Use this for:
     
     def _get_input_schema(self) -> dict:
         """Get the input schema, extending the base schema with viewport control."""
-        schema = BROWSER_TOOL_INPUT_SCHEMA.copy()
+        # Deep copy so the shared base schema isn't mutated
+        schema = copy.deepcopy(BROWSER_TOOL_INPUT_SCHEMA)
         
         # Add viewport setting for responsive testing
         schema["properties"]["viewport"] = {
@@ -226,14 +264,44 @@ Use this for:
             self.browser_tool.width = width
             self.browser_tool.height = height
     
+    async def _warm_up_browser(self) -> None:
+        """Launch the browser up front so the first action doesn't pay for it."""
+        # Holding a browser slot makes early tool calls wait for the launch
+        async with self._browser_slots:
+            try:
+                await self.browser_tool._ensure_browser()
+            except Exception as e:
+                # Not fatal: the first real action will retry the launch
+                print(f"[BrowserMCP] Browser warm-up failed: {e}", file=sys.stderr)
+    
+    async def _dispatch(self, request: dict, out) -> None:
+        """Handle one request and write its response (if any) to out."""
+        try:
+            response = await self.handle_request(request)
+            
+            # Send response (if not a notification). Writes are synchronous,
+            # so concurrent dispatches can't interleave within a line.
+            if response is not None:
+                _write_message(out, response)
+                out.flush()
+        except Exception as e:
+            print(f"[BrowserMCP] Error: {e}", file=sys.stderr)
+    
     async def run(self):
         """Run the MCP server, reading from stdin and writing to stdout."""
         print("[BrowserMCP] Server starting...", file=sys.stderr)
         
         loop = asyncio.get_event_loop()
-        reader = asyncio.StreamReader()
+        reader = asyncio.StreamReader(limit=STDIN_BUFFER_LIMIT)
         protocol = asyncio.StreamReaderProtocol(reader)
         await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+        out = sys.stdout.buffer
+        pending = set()
+        
+        # Launch the browser while the client is still initializing
+        warm_up = asyncio.create_task(self._warm_up_browser())
+        pending.add(warm_up)
+        warm_up.add_done_callback(pending.discard)
         
         while self.running:
             try:
@@ -242,29 +310,30 @@ Use this for:
                 if not line:
                     break
                 
-                line = line.decode('utf-8').strip()
-                if not line:
+                line = line.rstrip(b"\r\n")
+                if not line.strip():
                     continue
                 
-                # Parse JSON-RPC request
+                # Parse JSON-RPC request (both parsers accept bytes directly)
                 try:
-                    request = json.loads(line)
-                except json.JSONDecodeError:
+                    request = _json_loads(line)
+                except ValueError:
                     continue
                 
-                # Handle request
-                response = await self.handle_request(request)
-                
-                # Send response (if not a notification)
-                if response is not None:
-                    response_line = json.dumps(response) + "\n"
-                    sys.stdout.write(response_line)
-                    sys.stdout.flush()
+                # Handle request without blocking the read loop; responses
+                # carry the request id so they may complete out of order
+                task = asyncio.create_task(self._dispatch(request, out))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
                     
             except Exception as e:
                 print(f"[BrowserMCP] Error: {e}", file=sys.stderr)
                 continue
         
+        # Finish in-flight requests before the browser is torn down
+        if pending:
+            await asyncio.gather(*pending)
+        
         print("[BrowserMCP] Server stopped", file=sys.stderr)
     
     async def cleanup(self):
@@ -41,6 +41,40 @@ BUILTIN_TOOLS = [
     "Bash",
 ]
 
+# Absolute path to the Playwright MCP server script, resolved once at import
+BROWSER_MCP_SERVER_PATH = str((Path(__file__).parent / "browser_mcp_server.py").resolve())
+
+# Tool lists and MCP server config are constant, so build them once at import
+ALLOWED_TOOLS = (
+    *BUILTIN_TOOLS,
+    *PUPPETEER_TOOLS,
+    *BROWSER_VISUAL_TOOLS,
+)
+
+PERMISSION_ALLOW_LIST = (
+    # Allow all file operations within the project directory
+    "Read(./**)",
+    "Write(./**)",
+    "Edit(./**)",
+    "Glob(./**)",
+    "Grep(./**)",
+    # Bash permission granted here, but actual commands are validated
+    # by the bash_security_hook (see security.py for allowed commands)
+    "Bash(*)",
+    # Allow Puppeteer MCP tools for browser automation
+    *PUPPETEER_TOOLS,
+    # Allow browser visual testing tools (Playwright-based)
+    *BROWSER_VISUAL_TOOLS,
+)
+
+MCP_SERVERS = {
+    "puppeteer": {"command": "npx", "args": ["puppeteer-mcp-server"]},
+    "browser_visual": {
+        "command": "python3",
+        "args": [BROWSER_MCP_SERVER_PATH]
+    }
+}
+
 
 def create_client(project_dir: Path, model: str) -> ClaudeSDKClient:
     """
@@ -69,35 +103,29 @@ def create_client(project_dir: Path, model: str) -> ClaudeSDKClient:
         "sandbox": {"enabled": True, "autoAllowBashIfSandboxed": True},
         "permissions": {
             "defaultMode": "acceptEdits",  # Auto-approve edits within allowed directories
-            "allow": [
-                # Allow all file operations within the project directory
-                "Read(./**)",
-                "Write(./**)",
-                "Edit(./**)",
-                "Glob(./**)",
-                "Grep(./**)",
-                # Bash permission granted here, but actual commands are validated
-                # by the bash_security_hook (see security.py for allowed commands)
-                "Bash(*)",
-                # Allow Puppeteer MCP tools for browser automation
-                *PUPPETEER_TOOLS,
-                # Allow browser visual testing tools (Playwright-based)
-                *BROWSER_VISUAL_TOOLS,
-            ],
+            "allow": PERMISSION_ALLOW_LIST,  # Serialized only, so the tuple is shared
         },
     }
 
     # Ensure project directory exists before creating settings file
     project_dir.mkdir(parents=True, exist_ok=True)
-
-    # Write settings to a file in the project directory
-    settings_file = project_dir / ".claude_settings.json"
-    with open(settings_file, "w") as f:
-        json.dump(security_settings, f, indent=2)
-
-    print(f"Created security settings at {settings_file}")
+    resolved_project = project_dir.resolve()
+
+    # Write settings to a file in the project directory, skipping the write
+    # when a previous run already left identical settings there
+    settings_file = resolved_project / ".claude_settings.json"
+    payload = json.dumps(security_settings, indent=2).encode("utf-8")
+    try:
+        existing = settings_file.read_bytes()
+    except FileNotFoundError:
+        existing = None
+    if existing != payload:
+        settings_file.write_bytes(payload)
+        print(f"Created security settings at {settings_file}")
+    else:
+        print(f"Using existing security settings at {settings_file}")
     print("   - Sandbox enabled (OS-level bash isolation)")
-    print(f"   - Filesystem restricted to: {project_dir.resolve()}")
+    print(f"   - Filesystem restricted to: {resolved_project}")
     print("   - Bash commands restricted to allowlist (see security.py)")
     print("   - MCP servers: puppeteer (quick tests), browser_visual (visual/responsive testing)")
     print()
@@ -106,25 +134,15 @@ def create_client(project_dir: Path, model: str) -> ClaudeSDKClient:
         options=ClaudeAgentOptions(
             model=model,
             system_prompt="You are an expert full-stack developer building a production-quality web application.",
-            allowed_tools=[
-                *BUILTIN_TOOLS,
-                *PUPPETEER_TOOLS,
-                *BROWSER_VISUAL_TOOLS,
-            ],
-            mcp_servers={
-                "puppeteer": {"command": "npx", "args": ["puppeteer-mcp-server"]},
-                "browser_visual": {
-                    "command": "python3",
-                    "args": [str(Path(__file__).parent / "browser_mcp_server.py")]
-                }
-            },
+            allowed_tools=list(ALLOWED_TOOLS),
+            mcp_servers=MCP_SERVERS,
             hooks={
                 "PreToolUse": [
                     HookMatcher(matcher="Bash", hooks=[bash_security_hook]),
                 ],
             },
             max_turns=1000,
-            cwd=str(project_dir.resolve()),
-            settings=str(settings_file.resolve()),  # Use absolute path
+            cwd=str(resolved_project),
+            settings=str(settings_file),  # Absolute, derived from resolved_project
         )
     )
@@ -9,6 +9,9 @@ import json
 from pathlib import Path
 
 
+_BAR = "=" * 70
+
+
 def count_passing_tests(project_dir: Path) -> tuple[int, int]:
     """
     Count passing and total tests in feature_list.json.
@@ -40,10 +43,7 @@ def print_session_header(session_num: int, is_initializer: bool) -> None:
     """Print a formatted header for the session."""
     session_type = "INITIALIZER" if is_initializer else "CODING AGENT"
 
-    print("\n" + "=" * 70)
-    print(f"  SESSION {session_num}: {session_type}")
-    print("=" * 70)
-    print()
+    print(f"\n{_BAR}\n  SESSION {session_num}: {session_type}\n{_BAR}\n")
 
 
 def print_progress_summary(project_dir: Path) -> None:
@@ -6,7 +6,8 @@ Functions for loading prompt templates from the prompts directory.
 Supports custom spec files for different projects (e.g., NVMercantile/Nexus).
 """
 
-import shutil
+import os
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -16,8 +17,9 @@ PROMPTS_DIR = Path(__file__).parent / "prompts"
 DEFAULT_SPEC_FILE = "app_spec.txt"
 
 
+@lru_cache(maxsize=32)
 def load_prompt(name: str) -> str:
-    """Load a prompt template from the prompts directory."""
+    """Load a prompt template from the prompts directory (cached per process)."""
     prompt_path = PROMPTS_DIR / f"{name}.md"
     return prompt_path.read_text()
 
@@ -32,12 +34,18 @@ def get_coding_prompt() -> str:
     return load_prompt("coding_prompt")
 
 
-def get_available_specs() -> list[str]:
-    """List all available spec files in the prompts directory."""
-    specs = []
-    for f in PROMPTS_DIR.glob("*.txt"):
-        specs.append(f.name)
-    return sorted(specs)
+@lru_cache(maxsize=None)
+def get_available_specs() -> tuple[str, ...]:
+    """List all available spec files in the prompts directory (cached per process)."""
+    # DirEntry.is_file uses the type from the directory listing (only
+    # symlinks need an extra stat)
+    with os.scandir(PROMPTS_DIR) as entries:
+        specs = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".txt") and entry.is_file()
+        ]
+    return tuple(sorted(specs))
 
 
 def copy_spec_to_project(project_dir: Path, spec_file: str | None = None) -> None:
@@ -50,19 +58,29 @@ def copy_spec_to_project(project_dir: Path, spec_file: str | None = None) -> Non
                    If None, uses the default "app_spec.txt"
     """
     # Determine source spec file
-    if spec_file:
-        spec_source = PROMPTS_DIR / spec_file
-        if not spec_source.exists():
-            raise FileNotFoundError(f"Spec file not found: {spec_source}")
-    else:
-        spec_source = PROMPTS_DIR / DEFAULT_SPEC_FILE
+    spec_source = PROMPTS_DIR / (spec_file or DEFAULT_SPEC_FILE)
     
     # Always copy to "app_spec.txt" in project so prompts can reference it consistently
     spec_dest = project_dir / "app_spec.txt"
     
+    try:
+        dest_size = os.stat(spec_dest).st_size
+    except FileNotFoundError:
+        dest_size = None
+    
     # Copy if not exists, or if using a different spec file
-    if not spec_dest.exists() or spec_file:
-        shutil.copy(spec_source, spec_dest)
+    if dest_size is None or spec_file:
+        # Spec files are small: read and write in one shot each
+        try:
+            data = spec_source.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Spec file not found: {spec_source}") from None
+        
+        # Custom spec already in place from a previous run
+        if dest_size == len(data) and spec_dest.read_bytes() == data:
+            return
+        
+        spec_dest.write_bytes(data)
         if spec_file and spec_file != DEFAULT_SPEC_FILE:
             print(f"Copied {spec_file} -> project/app_spec.txt")
         else:
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Rate Limit Handling Tests
+=========================
+
+Tests for rate limit parsing and fallback backoff in the agent loop.
+Run with: python test_agent.py
+"""
+
+import asyncio
+import sys
+import time
+from email.utils import formatdate
+
+import agent
+from agent import (
+    BASE_FALLBACK_SECONDS,
+    FALLBACK_WAIT_EXTENDED_SECONDS,
+    FALLBACK_WAIT_FIRST_SECONDS,
+    MAX_RATE_LIMIT_WAIT_SECONDS,
+    get_fallback_wait_time,
+    parse_rate_limit_error,
+    run_agent_session,
+)
+
+
+class FailingClient:
+    """Stand-in for ClaudeSDKClient whose query raises the given error."""
+
+    def __init__(self, error: str):
+        self.error = error
+
+    async def query(self, message: str) -> None:
+        raise Exception(self.error)
+
+
+def test_parse_rate_limit_error():
+    """Test extraction of retry hints from rate limit errors."""
+    print("\nTesting rate limit error parsing:\n")
+    passed = 0
+    failed = 0
+
+    now = time.time()
+    future_date = formatdate(now + 600, usegmt=True)
+    past_date = formatdate(now - 600, usegmt=True)
+    far_future_date = formatdate(now + 10 * MAX_RATE_LIMIT_WAIT_SECONDS, usegmt=True)
+
+    # Test cases: (error, check, description)
+    test_cases = [
+        # Delay-seconds hints
+        ("429 Too Many Requests, retry-after: 30", lambda r: r == 30, "retry-after seconds"),
+        ("Rate limit exceeded. Retry_After: 45", lambda r: r == 45, "retry_after, mixed case"),
+        ("rate_limit_error: please wait 20 seconds", lambda r: r == 20, "wait X seconds"),
+        ("Overloaded, try again in 15", lambda r: r == 15, "try again in X"),
+        # HTTP-date hints
+        (f"429 Retry-After: {future_date}", lambda r: 590 <= r <= 600, "HTTP-date in the future"),
+        (f"429 Retry-After: {past_date}", lambda r: r == 0, "HTTP-date in the past"),
+        (
+            f"429 Retry-After: {far_future_date}",
+            lambda r: r == MAX_RATE_LIMIT_WAIT_SECONDS,
+            "HTTP-date clamped to max wait",
+        ),
+        # No hint
+        ("429 Too Many Requests", lambda r: r is None, "rate limited, no hint"),
+        ("Quota exceeded for this billing period", lambda r: r is None, "quota, no hint"),
+        # Not a rate limit error
+        ("Connection reset by peer", lambda r: r is None, "unrelated error"),
+        ("wait 20 seconds for the build", lambda r: r is None, "hint but no indicator"),
+    ]
+
+    for error, check, description in test_cases:
+        result = parse_rate_limit_error(error)
+        if check(result):
+            print(f"  PASS: {description} -> {result}")
+            passed += 1
+        else:
+            print(f"  FAIL: {description}")
+            print(f"         Error: {error!r}, Got: {result}")
+            failed += 1
+
+    return passed, failed
+
+
+def test_session_status():
+    """Test how run_agent_session classifies errors."""
+    print("\nTesting session error classification:\n")
+    passed = 0
+    failed = 0
+
+    # Test cases: (error, expected (status, response), description)
+    test_cases = [
+        ("429 Too Many Requests", ("rate_limited", ""), "rate limited, no hint"),
+        ("API overloaded", ("rate_limited", ""), "overloaded, no hint"),
+        ("429 retry-after: 30", ("rate_limited", "30"), "rate limited with hint"),
+        ("Connection reset by peer", ("error", "Connection reset by peer"), "unrelated error"),
+    ]
+
+    for error, expected, description in test_cases:
+        result = asyncio.run(run_agent_session(FailingClient(error), "prompt", None))
+        if result == expected:
+            print(f"  PASS: {description} -> {result}")
+            passed += 1
+        else:
+            print(f"  FAIL: {description}")
+            print(f"         Expected: {expected}, Got: {result}")
+            failed += 1
+
+    return passed, failed
+
+
+def test_fallback_backoff():
+    """Test the exponential fallback wait when no retry hint is given."""
+    print("\nTesting fallback backoff:\n")
+    passed = 0
+    failed = 0
+
+    original_uniform = agent.random.uniform
+    try:
+        # Check both ends of the jitter range
+        for jitter_name, jitter in (("min jitter", lambda a, b: a), ("max jitter", lambda a, b: b)):
+            agent.random.uniform = jitter
+
+            for used_fallback, ceiling in (
+                (False, FALLBACK_WAIT_FIRST_SECONDS),
+                (True, FALLBACK_WAIT_EXTENDED_SECONDS),
+            ):
+                waits = [get_fallback_wait_time(used_fallback, n) for n in range(16)]
+                label = f"used_fallback={used_fallback}, {jitter_name}"
+
+                checks = [
+                    ("starts low", waits[0] <= 2 * BASE_FALLBACK_SECONDS),
+                    ("monotonic", all(a <= b for a, b in zip(waits, waits[1:]))),
+                    ("respects ceiling", max(waits) <= ceiling),
+                    ("respects max wait", max(waits) <= MAX_RATE_LIMIT_WAIT_SECONDS),
+                ]
+                for check_name, ok in checks:
+                    if ok:
+                        print(f"  PASS: {label}: {check_name}")
+                        passed += 1
+                    else:
+                        print(f"  FAIL: {label}: {check_name}")
+                        print(f"         Waits: {waits}")
+                        failed += 1
+
+        # Long cascades without a header hit the 5 hour ceiling
+        agent.random.uniform = lambda a, b: a
+        wait = get_fallback_wait_time(False, 10)
+        if wait == FALLBACK_WAIT_FIRST_SECONDS:
+            print(f"  PASS: long cascade capped at first ceiling -> {wait}")
+            passed += 1
+        else:
+            print("  FAIL: long cascade capped at first ceiling")
+            print(f"         Expected: {FALLBACK_WAIT_FIRST_SECONDS}, Got: {wait}")
+            failed += 1
+    finally:
+        agent.random.uniform = original_uniform
+
+    return passed, failed
+
+
+def main():
+    print("=" * 70)
+    print("  RATE LIMIT HANDLING TESTS")
+    print("=" * 70)
+
+    passed = 0
+    failed = 0
+
+    # Test rate limit error parsing
+    parse_passed, parse_failed = test_parse_rate_limit_error()
+    passed += parse_passed
+    failed += parse_failed
+
+    # Test session error classification
+    session_passed, session_failed = test_session_status()
+    passed += session_passed
+    failed += session_failed
+
+    # Test fallback backoff
+    backoff_passed, backoff_failed = test_fallback_backoff()
+    passed += backoff_passed
+    failed += backoff_failed
+
+    # Summary
+    print("\n" + "-" * 70)
+    print(f"  Results: {passed} passed, {failed} failed")
+    print("-" * 70)
+
+    if failed == 0:
+        print("\n  ALL TESTS PASSED")
+        return 0
+    else:
+        print(f"\n  {failed} TEST(S) FAILED")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())